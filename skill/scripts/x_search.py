@@ -7,12 +7,13 @@ Goals:
 - sort/filter by engagement or recency
 - show cost transparency (estimates)
 
-Stdlib only (urllib). Requires env var: X_BEARER_TOKEN.
+Stdlib only (http.client); uses orjson for faster JSON when installed. Requires env var: X_BEARER_TOKEN.
 
 Examples:
   python scripts/x_search.py search --query "civic tech" --quick --sort likes --min-likes 10 --limit 10
   python scripts/x_search.py user-tweets --username "samuelrdt" --sort recent --limit 10
   python scripts/x_search.py tweet --id 2021125408075415667
+  python scripts/x_search.py tweet --ids 2021125408075415667,2021586493215519140
 
 Notes:
 - Read-only. Never posts.
@@ -22,19 +23,53 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import base64
+import hashlib
+import heapq
+import http.client
+import itertools
 import json
 import os
+import re
+import socket
+import sqlite3
 import sys
+import threading
+import time
 import urllib.parse
-import urllib.error
 import urllib.request
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+# _loads accepts str or UTF-8 bytes; _dumps returns UTF-8 bytes (stored as-is in the cache).
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
 
 API = "https://api.x.com/2"
 
+# Static query-string parts, encoded once at import instead of per request.
+_TWEET_EXPANSIONS_QS = urllib.parse.urlencode(
+    {
+        "tweet.fields": "created_at,public_metrics,author_id,conversation_id",
+        "expansions": "author_id",
+        "user.fields": "username,name,verified",
+    }
+)
+_USER_TWEETS_QS = "max_results=100&tweet.fields=created_at,public_metrics,conversation_id&exclude=replies,retweets"
+
 
 def _default_cache_dir() -> Path:
     # Keep runtime cache OUTSIDE the skill folder so packaging/commits stay clean.
@@ -64,153 +99,417 @@ class XRadarError(RuntimeError):
     """User-facing runtime error for predictable CLI failures."""
 
 
+# Read from the environment once per process; only a found token is kept.
+_BEARER: Optional[str] = None
+
+
 def _bearer() -> str:
-    token = os.getenv("X_BEARER_TOKEN") or os.getenv("TWITTER_BEARER_TOKEN")
-    if not token:
-        raise XRadarError("Missing X_BEARER_TOKEN env var")
-    return token
+    global _BEARER
+    if _BEARER is None:
+        token = os.getenv("X_BEARER_TOKEN") or os.getenv("TWITTER_BEARER_TOKEN")
+        if not token:
+            raise XRadarError("Missing X_BEARER_TOKEN env var")
+        _BEARER = token
+    return _BEARER
 
 
 def _cache_key(url: str) -> str:
-    # Stable file name for a request URL
-    import hashlib
+    # Stable cache key for a request URL. Only needs collision resistance, so 128-bit BLAKE2b.
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# L1: per-process memory cache, url -> (stored_at_epoch, encoded payload). FIFO eviction.
+# Bytes, not dicts: every hit decodes a fresh object, so callers can't mutate what others get.
+_MEM_CACHE: Dict[str, Tuple[float, bytes]] = {}
+_MEM_CACHE_MAX = 512
+
+# L2: one SQLite file under CACHE_DIR, opened lazily on first use.
+# Trimmed to the newest CACHE_MAX_ENTRIES rows each time it is opened.
+CACHE_MAX_ENTRIES = 50_000
+_DB: Optional[sqlite3.Connection] = None
+# Guards _MEM_CACHE writes and the shared SQLite connection.
+_CACHE_LOCK = threading.Lock()
+# Set after a failed cache write; the rest of the run skips SQLite (memory cache still works).
+_CACHE_DISABLED = False
+
+
+def _cache_db() -> sqlite3.Connection:
+    global _DB
+    if _DB is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        path = CACHE_DIR / "cache.db"
+        # Create the file owner-only before SQLite does; cached responses are account data.
+        os.close(os.open(str(path), os.O_WRONLY | os.O_CREAT, 0o600))
+        db = sqlite3.connect(str(path), isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        # etag / last_modified: validators for conditional re-fetches of expired rows.
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(k TEXT PRIMARY KEY, mtime REAL NOT NULL, body BLOB NOT NULL, etag TEXT, last_modified TEXT)"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS cache_mtime ON cache (mtime)")
+        _prune(db, CACHE_MAX_ENTRIES)
+        _DB = db
+    return _DB
+
+
+def _existing_cache_db() -> Optional[sqlite3.Connection]:
+    # Lookups must not create the cache; only _write_cache does.
+    if _DB is None and not (CACHE_DIR / "cache.db").exists():
+        return None
+    return _cache_db()
+
+
+def _prune(db: sqlite3.Connection, max_entries: int) -> int:
+    cur = db.execute(
+        "DELETE FROM cache WHERE k IN (SELECT k FROM cache ORDER BY mtime DESC LIMIT -1 OFFSET ?)",
+        (max(0, int(max_entries)),),
+    )
+    return cur.rowcount
 
-    return hashlib.sha256(url.encode("utf-8")).hexdigest()
 
+def prune_cache(max_entries: int = CACHE_MAX_ENTRIES) -> int:
+    """Delete all but the `max_entries` most recently written cache rows. Returns the number removed."""
+    with _CACHE_LOCK:
+        return _prune(_cache_db(), max_entries)
 
-def _cache_path(url: str) -> Path:
-    return CACHE_DIR / f"{_cache_key(url)}.json"
+
+def _remember(url: str, mtime: float, body: bytes) -> None:
+    if url not in _MEM_CACHE and len(_MEM_CACHE) >= _MEM_CACHE_MAX:
+        # dicts keep insertion order, so the first key is the oldest entry.
+        del _MEM_CACHE[next(iter(_MEM_CACHE))]
+    _MEM_CACHE[url] = (mtime, body)
 
 
 def _read_cache(url: str, ttl_seconds: int) -> Optional[Dict[str, Any]]:
+    now = time.time()
+    hit = _MEM_CACHE.get(url)
+    if hit is not None and now - hit[0] <= ttl_seconds:
+        return _loads(hit[1])
+    if _CACHE_DISABLED:
+        return None
     try:
-        p = _cache_path(url)
-        if not p.exists():
+        # Freshness is checked in the query, so expired bodies are never read or decoded.
+        with _CACHE_LOCK:
+            db = _existing_cache_db()
+            if db is None:
+                return None
+            row = db.execute(
+                "SELECT body, mtime FROM cache WHERE k=? AND mtime>=?", (_cache_key(url), now - ttl_seconds)
+            ).fetchone()
+        if row is None:
             return None
-        age = (datetime.now(timezone.utc) - datetime.fromtimestamp(p.stat().st_mtime, tz=timezone.utc)).total_seconds()
-        if age > ttl_seconds:
+        obj = _loads(row[0])
+    except (OSError, sqlite3.Error, ValueError):
+        return None
+    with _CACHE_LOCK:
+        _remember(url, row[1], row[0])
+    return obj
+
+
+def _read_stale(url: str) -> Optional[Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+    """Cached body plus ETag/Last-Modified, regardless of age. None if there is nothing to revalidate."""
+    if _CACHE_DISABLED:
+        return None
+    try:
+        with _CACHE_LOCK:
+            db = _existing_cache_db()
+            if db is None:
+                return None
+            row = db.execute("SELECT body, etag, last_modified FROM cache WHERE k=?", (_cache_key(url),)).fetchone()
+        if row is None or not (row[1] or row[2]):
             return None
-        return json.loads(p.read_text(encoding="utf-8"))
-    except Exception:
+        return _loads(row[0]), row[1], row[2]
+    except (OSError, sqlite3.Error, ValueError):
         return None
 
 
-def _write_cache(url: str, obj: Dict[str, Any]) -> None:
+def _disable_cache(exc: Exception) -> None:
+    global _CACHE_DISABLED
+    if not _CACHE_DISABLED:
+        _CACHE_DISABLED = True
+        # stderr keeps stdout valid JSON; a silently broken cache would bill every call.
+        print(f"x-radar: cache disabled for this run ({CACHE_DIR}): {exc}", file=sys.stderr)
+
+
+def _write_cache(url: str, obj: Dict[str, Any], etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+    now = time.time()
+    body = _dumps(obj)
+    with _CACHE_LOCK:
+        _remember(url, now, body)
+    if _CACHE_DISABLED:
+        return
     try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        _cache_path(url).write_text(json.dumps(obj, ensure_ascii=False), encoding="utf-8")
-    except Exception:
-        pass
+        with _CACHE_LOCK:
+            # Single-statement autocommit: readers in other processes see the old row or the new one, never a partial write.
+            _cache_db().execute(
+                "INSERT OR REPLACE INTO cache (k, mtime, body, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+                (_cache_key(url), now, body, etag, last_modified),
+            )
+    except (OSError, sqlite3.Error) as exc:
+        _disable_cache(exc)
+
+
+def _touch_cache(url: str, obj: Dict[str, Any]) -> None:
+    # 304 Not Modified: the cached body is current again, restart its TTL.
+    now = time.time()
+    body = _dumps(obj)
+    with _CACHE_LOCK:
+        _remember(url, now, body)
+    if _CACHE_DISABLED:
+        return
+    try:
+        with _CACHE_LOCK:
+            _cache_db().execute("UPDATE cache SET mtime=? WHERE k=?", (now, _cache_key(url)))
+    except (OSError, sqlite3.Error) as exc:
+        _disable_cache(exc)
+
+
+# One keep-alive connection per thread, reused across requests to skip repeated TCP/TLS handshakes.
+# http.client connections are not safe to share between threads.
+_LOCAL = threading.local()
+
+# Requests currently being fetched, url -> Event set when the fetch finishes.
+# Concurrent callers for the same url wait on it instead of calling the API again.
+_INFLIGHT: Dict[str, threading.Event] = {}
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT_WAIT_SECONDS = 25
+
+
+def _new_conn() -> http.client.HTTPSConnection:
+    api = urllib.parse.urlsplit(API)
+    # Honour HTTPS_PROXY / https_proxy (and no_proxy) like urllib.request.urlopen does.
+    proxy = urllib.request.getproxies().get("https")
+    if not proxy or urllib.request.proxy_bypass(api.hostname):
+        return http.client.HTTPSConnection(api.netloc, timeout=20)
+    p = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    conn = http.client.HTTPSConnection(p.hostname, p.port or 80, timeout=20)
+    tunnel_headers = {}
+    if p.username:
+        cred = f"{urllib.parse.unquote(p.username)}:{urllib.parse.unquote(p.password or '')}"
+        tunnel_headers["Proxy-Authorization"] = "Basic " + base64.b64encode(cred.encode("utf-8")).decode("ascii")
+    conn.set_tunnel(api.hostname, api.port or 443, headers=tunnel_headers)
+    return conn
+
+
+def _get_conn() -> http.client.HTTPSConnection:
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is None:
+        conn = _LOCAL.conn = _new_conn()
+    return conn
+
+
+def _drop_conn() -> None:
+    conn = getattr(_LOCAL, "conn", None)
+    if conn is not None:
+        conn.close()
+        _LOCAL.conn = None
 
 
 def _get(url: str, *, cache_ttl_seconds: int = 900, no_cache: bool = False) -> Tuple[Dict[str, Any], bool]:
-    if not no_cache and cache_ttl_seconds > 0:
+    use_cache = not no_cache and cache_ttl_seconds > 0
+    if not use_cache:
+        return _fetch(url)[0], False
+
+    cached = _read_cache(url, cache_ttl_seconds)
+    if cached is not None:
+        return cached, True
+
+    while True:
+        with _INFLIGHT_LOCK:
+            event = _INFLIGHT.get(url)
+            if event is None:
+                event = _INFLIGHT[url] = threading.Event()
+                break
+        event.wait(timeout=_INFLIGHT_WAIT_SECONDS)
         cached = _read_cache(url, cache_ttl_seconds)
         if cached is not None:
             return cached, True
+        # The other fetch failed or is still running: elect again so only one waiter retries.
 
-    req = urllib.request.Request(url)
-    req.add_header("Authorization", f"Bearer {_bearer()}")
-    req.add_header("User-Agent", "x-radar/0.3")
     try:
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            data = resp.read().decode("utf-8")
-    except urllib.error.HTTPError as exc:
-        detail = "no additional details"
+        # A fetch may have finished between our cache miss and registering.
+        cached = _read_cache(url, cache_ttl_seconds)
+        if cached is not None:
+            return cached, True
+        return _refresh(url)
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(url, None)
+        event.set()
+
+
+def _refresh(url: str) -> Tuple[Dict[str, Any], bool]:
+    # Expired entries that carry validators are revalidated instead of re-downloaded.
+    stale = _read_stale(url)
+    if stale is None:
+        obj, etag, last_modified = _fetch(url)
+    else:
+        obj, etag, last_modified = _fetch(url, etag=stale[1], last_modified=stale[2])
+        if obj is None:
+            _touch_cache(url, stale[0])
+            return stale[0], True
+    _write_cache(url, obj, etag, last_modified)
+    return obj, False
+
+
+def _extract_api_error(body: bytes) -> str:
+    """Short human-readable detail from an X API error body (JSON or not), at most 160 chars."""
+    if not body:
+        return "no additional details"
+    try:
+        obj = _loads(body)
+    except ValueError:
+        return " ".join(body.decode("utf-8", errors="replace").split())[:160] or "no additional details"
+    if not isinstance(obj, dict):
+        return "no additional details"
+    errors = obj.get("errors")
+    first = errors[0] if isinstance(errors, list) and errors and isinstance(errors[0], dict) else obj
+    detail = first.get("message") or first.get("detail") or first.get("title") or first.get("error")
+    return str(detail)[:160] if detail else "no additional details"
+
+
+def _fetch(
+    url: str, *, etag: Optional[str] = None, last_modified: Optional[str] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[str], Optional[str]]:
+    """GET url. Returns (payload, ETag, Last-Modified); payload is None on 304 Not Modified."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    headers = {
+        "Authorization": f"Bearer {_bearer()}",
+        "User-Agent": "x-radar/0.3",
+        "Connection": "keep-alive",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    for attempt in range(2):
+        conn = _get_conn()
         try:
-            body = exc.read().decode("utf-8", errors="replace")
-            if body:
-                try:
-                    err_obj = json.loads(body)
-                    if isinstance(err_obj, dict):
-                        errors = err_obj.get("errors")
-                        if isinstance(errors, list) and errors and isinstance(errors[0], dict):
-                            detail = str(errors[0].get("message") or errors[0].get("detail") or errors[0].get("title") or detail)
-                        else:
-                            detail = str(err_obj.get("detail") or err_obj.get("title") or err_obj.get("error") or detail)
-                except Exception:
-                    compact = " ".join(body.split())
-                    if compact:
-                        detail = compact[:160]
-        except Exception:
-            pass
-        raise XRadarError(f"X API request failed ({exc.code} {exc.reason}): {detail}") from None
-    except urllib.error.URLError as exc:
-        raise XRadarError(f"Network error while calling X API: {exc.reason}") from None
-    except TimeoutError:
-        raise XRadarError("Request to X API timed out") from None
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            status, reason = resp.status, resp.reason
+            resp_etag, resp_last_modified = resp.getheader("ETag"), resp.getheader("Last-Modified")
+            raw_body = resp.read()
+            break
+        except (TimeoutError, socket.timeout):
+            _drop_conn()
+            raise XRadarError("Request to X API timed out") from None
+        except (ConnectionError, http.client.BadStatusLine) as exc:
+            # The server may have closed an idle keep-alive socket; reconnect once.
+            _drop_conn()
+            if attempt:
+                raise XRadarError(f"Network error while calling X API: {exc}") from None
+        except (http.client.HTTPException, OSError) as exc:
+            _drop_conn()
+            raise XRadarError(f"Network error while calling X API: {exc}") from None
+
+    if status == 304:
+        return None, resp_etag or etag, resp_last_modified or last_modified
+
+    if not 200 <= status < 300:
+        detail = _extract_api_error(raw_body)
+        raise XRadarError(f"X API request failed ({status} {reason}): {detail}")
 
     try:
-        obj = json.loads(data)
-    except json.JSONDecodeError:
+        # Both json.loads and orjson.loads take bytes; skip the intermediate str.
+        return _loads(raw_body), resp_etag, resp_last_modified
+    except ValueError:  # JSONDecodeError (orjson's subclasses it) or invalid UTF-8
         raise XRadarError("X API returned invalid JSON response") from None
 
-    if not no_cache and cache_ttl_seconds > 0:
-        _write_cache(url, obj)
 
-    return obj, False
+_SINCE_RE = re.compile(r"(\d+(?:\.\d+)?)([hd])")
 
 
 def _parse_since(value: str) -> timedelta:
-    raw = value.strip().lower()
-    if raw.endswith("h"):
-        return timedelta(hours=float(raw[:-1]))
-    if raw.endswith("d"):
-        return timedelta(days=float(raw[:-1]))
-    raise ValueError("--since must be like 1h, 3h, 12h, 1d, 7d")
+    m = _SINCE_RE.fullmatch(value.strip().lower())
+    if not m:
+        raise ValueError("--since must be like 1h, 3h, 12h, 1d, 7d")
+    n = float(m.group(1))
+    return timedelta(hours=n) if m.group(2) == "h" else timedelta(days=n)
 
 
 def _to_iso_utc(dt: datetime) -> str:
     return dt.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
-def _metric(tweet: Dict[str, Any], key: str) -> int:
-    metrics = tweet.get("public_metrics") or {}
-    val = metrics.get(key)
+def _as_int(val: Any) -> int:
     try:
         return int(val or 0)
     except (TypeError, ValueError):
         return 0
 
 
+_RowFn = Callable[[int, int, int, str, int, Dict[str, Any]], Tuple]
+
+
 def _created_at(tweet: Dict[str, Any]) -> str:
     # ISO 8601 string; lexicographic works for UTC timestamps.
     return str(tweet.get("created_at") or "")
 
 
-def _sort_key(tweet: Dict[str, Any], sort: str) -> Tuple:
+def _row_builder(sort: str) -> Optional[_RowFn]:
+    """Pick the ranking-row builder for `sort` once, instead of branching on it for every tweet.
+
+    Rows compare on the sort keys, then -index so ties keep input order and the tweet dict is never compared.
+    Returns None for "recent": there is only one key, so _prepare ranks the tweets themselves with key=_created_at.
+    """
     s = sort.lower()
     if s == "likes":
-        return (_metric(tweet, "like_count"), _metric(tweet, "reply_count"), _created_at(tweet))
+        return lambda likes, replies, rts, created, i, t: (likes, replies, created, -i, t)
     if s == "replies":
-        return (_metric(tweet, "reply_count"), _metric(tweet, "like_count"), _created_at(tweet))
+        return lambda likes, replies, rts, created, i, t: (replies, likes, created, -i, t)
     if s == "retweets":
-        return (_metric(tweet, "retweet_count"), _metric(tweet, "like_count"), _created_at(tweet))
+        return lambda likes, replies, rts, created, i, t: (rts, likes, created, -i, t)
     # default: recent
-    return (_created_at(tweet),)
+    return None
 
 
-def _filter_tweets(
+def _prepare(
     tweets: List[Dict[str, Any]],
+    sort: str,
     *,
+    limit: int,
     min_likes: int = 0,
     min_replies: int = 0,
     min_retweets: int = 0,
 ) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    for t in tweets:
-        if _metric(t, "like_count") < min_likes:
-            continue
-        if _metric(t, "reply_count") < min_replies:
-            continue
-        if _metric(t, "retweet_count") < min_retweets:
+    """Filter by min metrics and return the top `limit` tweets for `sort`, reading each tweet once."""
+    row_fn = _row_builder(sort)
+    rows: List[Any] = []
+    for i, t in enumerate(tweets):
+        pm = t.get("public_metrics") or {}
+        likes = _as_int(pm.get("like_count"))
+        replies = _as_int(pm.get("reply_count"))
+        rts = _as_int(pm.get("retweet_count"))
+        if likes < min_likes or replies < min_replies or rts < min_retweets:
             continue
-        out.append(t)
-    return out
+        rows.append(t if row_fn is None else row_fn(likes, replies, rts, _created_at(t), i, t))
+
+    # Top-k selection: O(n log k) instead of sorting everything and slicing.
+    k = max(1, int(limit))
+    if row_fn is None:
+        # Same result as sorted(key=..., reverse=True)[:k], so ties keep input order.
+        return heapq.nlargest(k, rows, key=_created_at)
+    return [row[-1] for row in heapq.nlargest(k, rows)]
+
 
+# Static part of every cost block. Shared, not copied: callers only serialize it, never mutate it.
+_ASSUMPTIONS: Dict[str, Any] = {
+    "post_read_usd": COST_POST_READ_USD,
+    "user_lookup_usd": COST_USER_LOOKUP_USD,
+    "pricing_last_reviewed_utc": PRICING_LAST_REVIEWED_UTC,
+    "note": "Estimate only. Actual X billing may differ by tier/resource.",
+}
 
-@dataclass
+
+@dataclass(frozen=True)
 class CostEstimate:
+    # Hand-written __slots__ because dataclass(slots=True) needs Python 3.10.
+    __slots__ = ("requests", "post_reads", "user_lookups")
+
     requests: int
     post_reads: int
     user_lookups: int
@@ -225,12 +524,7 @@ class CostEstimate:
             "post_reads": self.post_reads,
             "user_lookups": self.user_lookups,
             "estimated_usd": round(self.usd, 3),
-            "assumptions": {
-                "post_read_usd": COST_POST_READ_USD,
-                "user_lookup_usd": COST_USER_LOOKUP_USD,
-                "pricing_last_reviewed_utc": PRICING_LAST_REVIEWED_UTC,
-                "note": "Estimate only. Actual X billing may differ by tier/resource.",
-            },
+            "assumptions": _ASSUMPTIONS,
         }
 
 
@@ -266,24 +560,20 @@ def search_recent(
 
     # Fetch results; in quick mode we request fewer items.
     max_results = 10 if quick else 100
-    qp = {
-        "query": q,
-        "max_results": str(max_results),
-        "tweet.fields": "created_at,public_metrics,author_id,conversation_id",
-        "expansions": "author_id",
-        "user.fields": "username,name,verified",
-    }
+    url = f"{API}/tweets/search/recent?query={urllib.parse.quote_plus(q)}&max_results={max_results}&{_TWEET_EXPANSIONS_QS}"
     if start_time:
-        qp["start_time"] = start_time
-
-    url = f"{API}/tweets/search/recent?{urllib.parse.urlencode(qp)}"
+        url += f"&start_time={urllib.parse.quote_plus(start_time)}"
     ttl = 3600 if quick else 900
     raw, cache_hit = _get(url, cache_ttl_seconds=ttl)
 
-    tweets = list(raw.get("data") or [])
-    tweets = _filter_tweets(tweets, min_likes=min_likes, min_replies=min_replies, min_retweets=min_retweets)
-    tweets.sort(key=lambda t: _sort_key(t, sort), reverse=True)
-    tweets = tweets[: max(1, int(limit))]
+    tweets = _prepare(
+        raw.get("data") or [],
+        sort,
+        limit=limit,
+        min_likes=min_likes,
+        min_replies=min_replies,
+        min_retweets=min_retweets,
+    )
 
     cost = CostEstimate(requests=0 if cache_hit else 1, post_reads=0 if cache_hit else len(raw.get("data") or []), user_lookups=0)
 
@@ -310,16 +600,54 @@ def user_by_username(username: str, *, cache_ttl_seconds: int = 900, no_cache: b
     return _get(url, cache_ttl_seconds=cache_ttl_seconds, no_cache=no_cache)
 
 
+TWEET_IDS_PER_REQUEST = 100  # X API v2 limit for GET /2/tweets?ids=
+
+
+def _fetch_tweets(ids: List[str], *, cache_ttl_seconds: int, no_cache: bool) -> Tuple[Dict[str, Any], CostEstimate]:
+    data: List[Dict[str, Any]] = []
+    includes: Dict[str, List[Dict[str, Any]]] = {}
+    errors: List[Dict[str, Any]] = []
+    seen: Dict[str, set] = {}
+    requests = post_reads = 0
+
+    it = iter(ids)
+    while True:
+        chunk = list(itertools.islice(it, TWEET_IDS_PER_REQUEST))
+        if not chunk:
+            break
+        url = f"{API}/tweets?ids={urllib.parse.quote_plus(','.join(chunk))}&{_TWEET_EXPANSIONS_QS}"
+        raw, cache_hit = _get(url, cache_ttl_seconds=cache_ttl_seconds, no_cache=no_cache)
+
+        chunk_data = raw.get("data") or []
+        data.extend(chunk_data)
+        errors.extend(raw.get("errors") or [])
+        for kind, items in (raw.get("includes") or {}).items():
+            # The same author can be expanded in several chunks; keep one copy.
+            bucket = includes.setdefault(kind, [])
+            ids_seen = seen.setdefault(kind, set())
+            for item in items:
+                item_id = item.get("id") if isinstance(item, dict) else None
+                if item_id is not None:
+                    if item_id in ids_seen:
+                        continue
+                    ids_seen.add(item_id)
+                bucket.append(item)
+        if not cache_hit:
+            requests += 1
+            post_reads += len(chunk_data)
+
+    merged = {"data": data, "includes": includes or None, "errors": errors or None}
+    return merged, CostEstimate(requests=requests, post_reads=post_reads, user_lookups=0)
+
+
+def tweets_by_ids(ids: List[str], *, cache_ttl_seconds: int = 900, no_cache: bool = False) -> Tuple[Dict[str, Any], bool]:
+    """Fetch many tweets, 100 ids per request. Returns merged data/includes/errors and whether all chunks were cached."""
+    merged, cost = _fetch_tweets([str(i) for i in ids], cache_ttl_seconds=cache_ttl_seconds, no_cache=no_cache)
+    return merged, cost.requests == 0
+
+
 def tweet_by_id(tweet_id: str, *, cache_ttl_seconds: int = 900, no_cache: bool = False) -> Tuple[Dict[str, Any], bool]:
-    tid = urllib.parse.quote(str(tweet_id))
-    qp = {
-        "ids": tid,
-        "tweet.fields": "created_at,public_metrics,author_id,conversation_id",
-        "expansions": "author_id",
-        "user.fields": "username,name,verified",
-    }
-    url = f"{API}/tweets?{urllib.parse.urlencode(qp)}"
-    return _get(url, cache_ttl_seconds=cache_ttl_seconds, no_cache=no_cache)
+    return tweets_by_ids([tweet_id], cache_ttl_seconds=cache_ttl_seconds, no_cache=no_cache)
 
 
 def user_tweets(
@@ -336,18 +664,17 @@ def user_tweets(
     if not user_id:
         return {"error": "user not found", "user": user_raw}
 
-    max_results = 100
-    url = (
-        f"{API}/users/{user_id}/tweets?max_results={max_results}"
-        f"&tweet.fields=created_at,public_metrics,conversation_id"
-        f"&exclude=replies,retweets"
-    )
+    url = f"{API}/users/{user_id}/tweets?{_USER_TWEETS_QS}"
     raw, cache_hit_tweets = _get(url, cache_ttl_seconds=900)
 
-    tweets = list(raw.get("data") or [])
-    tweets = _filter_tweets(tweets, min_likes=min_likes, min_replies=min_replies, min_retweets=min_retweets)
-    tweets.sort(key=lambda t: _sort_key(t, sort), reverse=True)
-    tweets = tweets[: max(1, int(limit))]
+    tweets = _prepare(
+        raw.get("data") or [],
+        sort,
+        limit=limit,
+        min_likes=min_likes,
+        min_replies=min_replies,
+        min_retweets=min_retweets,
+    )
 
     requests = (0 if cache_hit_user else 1) + (0 if cache_hit_tweets else 1)
     cost = CostEstimate(
@@ -392,7 +719,33 @@ def _non_negative_int(value: str) -> int:
     return n
 
 
+def _parse_tweet_ids(values: List[str]) -> List[str]:
+    # Accept "1 2", "1,2" or a mix; drop duplicates so each id is billed once.
+    ids: List[str] = []
+    seen = set()
+    for value in values:
+        for part in value.split(","):
+            part = part.strip()
+            if part and part not in seen:
+                seen.add(part)
+                ids.append(part)
+    if not ids:
+        raise ValueError("--id/--ids must contain at least one tweet id")
+    return ids
+
+
 def _write_json(obj: Dict[str, Any]) -> None:
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        buf = getattr(sys.stdout, "buffer", None)
+        if buf is not None:
+            # Raw UTF-8 bytes, so no stdout reconfigure needed.
+            sys.stdout.flush()
+            buf.write(data)
+            buf.flush()
+        else:
+            sys.stdout.write(data.decode("utf-8"))
+        return
     # Windows terminals can choke on unicode (cp1252). Force UTF-8 stdout.
     try:
         sys.stdout.reconfigure(encoding="utf-8")
@@ -420,8 +773,10 @@ def main(argv: Optional[List[str]] = None) -> int:
     s.add_argument("--min-retweets", type=_non_negative_int, default=0)
     s.add_argument("--quick", action="store_true", help="Cheap pulse check (defaults: since=24h, -is:reply, -is:retweet, max_results=10)")
 
-    t = sub.add_parser("tweet", help="Fetch a single tweet by id")
-    t.add_argument("--id", required=True, help="Tweet id")
+    t = sub.add_parser("tweet", help="Fetch tweets by id (batched, 100 per request)")
+    tg = t.add_mutually_exclusive_group(required=True)
+    tg.add_argument("--id", nargs="+", help="Tweet id(s), space separated")
+    tg.add_argument("--ids", help="Comma-separated tweet ids")
     t.add_argument("--no-cache", action="store_true")
 
     u = sub.add_parser("user-tweets", help="Get recent tweets from a username")
@@ -447,18 +802,17 @@ def main(argv: Optional[List[str]] = None) -> int:
                 quick=args.quick,
             )
         elif args.cmd == "tweet":
-            raw, cache_hit = tweet_by_id(args.id, cache_ttl_seconds=900, no_cache=args.no_cache)
-            # cost estimate: one tweet read if not cached
+            ids = _parse_tweet_ids(args.id or [args.ids])
+            raw, cost = _fetch_tweets(ids, cache_ttl_seconds=900, no_cache=args.no_cache)
+            meta: Dict[str, Any] = {"mode": "tweet"}
+            if len(ids) == 1:
+                meta["id"] = ids[0]
+            meta.update({"ids": ids, "cache_hit": cost.requests == 0, "cost": cost.as_dict()})
             out = {
-                "x_radar": {
-                    "mode": "tweet",
-                    "id": str(args.id),
-                    "cache_hit": bool(cache_hit),
-                    "cost": CostEstimate(requests=0 if cache_hit else 1, post_reads=0 if cache_hit else 1, user_lookups=0).as_dict(),
-                },
-                "data": (raw.get("data") or []),
-                "includes": raw.get("includes"),
-                "errors": raw.get("errors"),
+                "x_radar": meta,
+                "data": raw["data"],
+                "includes": raw["includes"],
+                "errors": raw["errors"],
             }
         else:
             out = user_tweets(